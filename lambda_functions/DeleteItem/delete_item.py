@@ -61,10 +61,52 @@ import json
 import boto3
 from botocore.exceptions import ClientError
 import os
+import time
+from botocore.config import Config
 
-dynamodb_resource = boto3.resource('dynamodb')
+# Shared HTTP client tuning: keep warm connections alive across invocations,
+# allow enough pooled connections for parallel calls, and use adaptive retry
+# mode so throttled requests back off with jitter
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    connect_timeout=1.0,
+    read_timeout=5.0
+)
+
+# Low-level client instead of the resource layer: skips loading the resource
+# factory and per-call Python-side type marshalling on cold start
+dynamodb_client = boto3.client('dynamodb', config=botocore_client_config)
 lost_and_found_items_table_name = os.environ.get('ITEMS_TABLE', 'FindersKeeper-Items')
-lost_and_found_items_table = dynamodb_resource.Table(lost_and_found_items_table_name)
+
+# Per-container cache of parsed group memberships keyed by Cognito sub.
+# Entries expire at the token's own exp (capped at 60s) so a revoked admin
+# cannot keep privileges past token expiry.
+cached_group_memberships_by_user_sub = {}
+
+def get_cached_group_memberships(cognito_user_claims):
+    user_sub = cognito_user_claims.get('sub')
+    current_time = time.time()
+
+    cached_entry = cached_group_memberships_by_user_sub.get(user_sub)
+    if cached_entry and cached_entry[1] > current_time:
+        return cached_entry[0]
+
+    raw_group_claim = cognito_user_claims.get('cognito:groups') or ''
+    if isinstance(raw_group_claim, str):
+        group_memberships = frozenset(raw_group_claim.split(',')) if raw_group_claim else frozenset()
+    else:
+        group_memberships = frozenset(raw_group_claim)
+
+    if user_sub:
+        token_expiry_epoch = int(cognito_user_claims.get('exp', 0))
+        cache_entry_expires_at = min(token_expiry_epoch or current_time + 60, current_time + 60)
+        if len(cached_group_memberships_by_user_sub) > 256:
+            cached_group_memberships_by_user_sub.pop(next(iter(cached_group_memberships_by_user_sub)))
+        cached_group_memberships_by_user_sub[user_sub] = (group_memberships, cache_entry_expires_at)
+
+    return group_memberships
 
 def delete_lost_or_found_item_with_ownership_validation(api_gateway_event, lambda_context):
     """
@@ -93,23 +135,31 @@ def delete_lost_or_found_item_with_ownership_validation(api_gateway_event, lambd
         authenticated_user_unique_id = cognito_user_claims['sub']
         authenticated_user_email_address = cognito_user_claims['email']
         
-        cognito_user_group_memberships = cognito_user_claims.get('cognito:groups', '')
-        if isinstance(cognito_user_group_memberships, str):
-            cognito_user_group_memberships = cognito_user_group_memberships.split(',') if cognito_user_group_memberships else []
-        user_has_admin_privileges = 'Admins' in cognito_user_group_memberships
-        
-        dynamodb_get_response = lost_and_found_items_table.get_item(Key={'id': item_id_to_delete})
+        user_has_admin_privileges = 'Admins' in get_cached_group_memberships(cognito_user_claims)
         
-        if 'Item' not in dynamodb_get_response:
+        # Single conditional delete instead of GET-then-DELETE: one round-trip,
+        # and the ownership check happens atomically on the DynamoDB side
+        try:
+            dynamodb_client.delete_item(
+                TableName=lost_and_found_items_table_name,
+                Key={'id': {'S': item_id_to_delete}},
+                ConditionExpression='attribute_exists(id) AND (userId = :uid OR :admin = :t)',
+                ExpressionAttributeValues={
+                    ':uid': {'S': authenticated_user_unique_id},
+                    ':admin': {'BOOL': user_has_admin_privileges},
+                    ':t': {'BOOL': True}
+                },
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+        except ClientError as conditional_delete_error:
+            if conditional_delete_error.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            # The old item is returned when the item exists but the condition
+            # failed, which distinguishes "not the owner" from "not found"
+            if conditional_delete_error.response.get('Item'):
+                raise ValueError('Forbidden: You can only delete your own items')
             raise ValueError('Item not found')
         
-        existing_item_record = dynamodb_get_response['Item']
-        
-        if existing_item_record.get('userId') != authenticated_user_unique_id and not user_has_admin_privileges:
-            raise ValueError('Forbidden: You can only delete your own items')
-        
-        lost_and_found_items_table.delete_item(Key={'id': item_id_to_delete})
-        
         return {
             'success': True,
             'message': 'Item deleted successfully'
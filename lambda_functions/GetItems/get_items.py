@@ -75,23 +75,42 @@ AWS Academy Learner Lab Pattern:
 - Uses botocore.exceptions.ClientError for error handling
 """
 
+import heapq
 import json
 import boto3
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.conditions import Key, Attr, And
+from botocore.config import Config
 from decimal import Decimal
 import os
 from datetime import datetime
 
-dynamodb_resource = boto3.resource('dynamodb')
+# Shared HTTP client tuning: keep warm connections alive across invocations,
+# allow enough pooled connections for parallel calls, and use adaptive retry
+# mode so throttled requests back off with jitter
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    connect_timeout=1.0,
+    read_timeout=5.0
+)
+
+dynamodb_resource = boto3.resource('dynamodb', config=botocore_client_config)
 items_table_name = os.environ.get('ITEMS_TABLE', 'FindersKeeper-Items')
 lost_and_found_items_table = dynamodb_resource.Table(items_table_name)
 
-class DynamoDBDecimalToJSONEncoder(json.JSONEncoder):
-    def default(self, decimal_object):
-        if isinstance(decimal_object, Decimal):
-            return int(decimal_object) if decimal_object % 1 == 0 else float(decimal_object)
-        return super(DynamoDBDecimalToJSONEncoder, self).default(decimal_object)
+# GSI with a constant partition key and createdAt sort key so DynamoDB returns
+# items already sorted newest-first (every item is written with gsiBucket='ALL')
+recent_items_index_name = os.environ.get('RECENT_ITEMS_INDEX', 'RecentItemsIndex')
+recent_items_gsi_partition_value = 'ALL'
+
+def convert_decimal_for_json(decimal_object):
+    """json.dumps default hook - cheaper than a JSONEncoder subclass, which
+    is re-instantiated on every dumps call."""
+    if isinstance(decimal_object, Decimal):
+        return int(decimal_object) if decimal_object % 1 == 0 else float(decimal_object)
+    raise TypeError(f"Object of type {type(decimal_object).__name__} is not JSON serializable")
 
 
 def fetch_paginated_lost_and_found_items_with_filters(api_gateway_event, lambda_context):
@@ -117,46 +136,94 @@ def fetch_paginated_lost_and_found_items_with_filters(api_gateway_event, lambda_
         category_filter_value = query_string_parameters.get('category')
         pagination_last_evaluated_key = query_string_parameters.get('lastKey')
         
-        dynamodb_scan_parameters = {
-            'Limit': maximum_items_to_return * 2
-        }
-        
         filter_expression_conditions = []
-        
+
         if item_status_filter_value:
             filter_expression_conditions.append(Attr('status').eq(item_status_filter_value))
-        
+
         if category_filter_value:
             filter_expression_conditions.append(Attr('category').eq(category_filter_value))
-        
-        if filter_expression_conditions:
+
+        combined_filter_expression = None
+        if len(filter_expression_conditions) == 1:
             combined_filter_expression = filter_expression_conditions[0]
-            for expression_condition in filter_expression_conditions[1:]:
-                combined_filter_expression = combined_filter_expression & expression_condition
-            dynamodb_scan_parameters['FilterExpression'] = combined_filter_expression
-        
-        if pagination_last_evaluated_key:
-            dynamodb_scan_parameters['ExclusiveStartKey'] = json.loads(pagination_last_evaluated_key)
-        
-        dynamodb_scan_response = lost_and_found_items_table.scan(**dynamodb_scan_parameters)
-        
-        items_sorted_by_creation_date = sorted(
-            dynamodb_scan_response.get('Items', []),
-            key=lambda item_record: item_record.get('createdAt', ''),
-            reverse=True
-        )
-        
+        elif filter_expression_conditions:
+            # Build one flat And node instead of folding pairwise
+            combined_filter_expression = And(*filter_expression_conditions)
+
+        try:
+            # Query the RecentItemsIndex GSI - items come back already sorted
+            # by createdAt descending, so no in-Python sort is needed.
+            # FilterExpression is applied after the key condition, so keep
+            # querying pages until the requested count is filled (bounded at
+            # 4 pages); the small +8 buffer compensates for filtered-out items
+            # without blanket over-fetching.
+            items_sorted_by_creation_date = []
+            next_exclusive_start_key = json.loads(pagination_last_evaluated_key) if pagination_last_evaluated_key else None
+            query_pages_fetched = 0
+            dynamodb_read_response = {}
+
+            while len(items_sorted_by_creation_date) < maximum_items_to_return and query_pages_fetched < 4:
+                dynamodb_query_parameters = {
+                    'IndexName': recent_items_index_name,
+                    'KeyConditionExpression': Key('gsiBucket').eq(recent_items_gsi_partition_value),
+                    'ScanIndexForward': False,
+                    'Limit': maximum_items_to_return - len(items_sorted_by_creation_date) + 8
+                }
+
+                if combined_filter_expression is not None:
+                    dynamodb_query_parameters['FilterExpression'] = combined_filter_expression
+
+                if next_exclusive_start_key:
+                    dynamodb_query_parameters['ExclusiveStartKey'] = next_exclusive_start_key
+
+                dynamodb_read_response = lost_and_found_items_table.query(**dynamodb_query_parameters)
+                items_sorted_by_creation_date.extend(dynamodb_read_response.get('Items', []))
+                next_exclusive_start_key = dynamodb_read_response.get('LastEvaluatedKey')
+                query_pages_fetched += 1
+
+                if not next_exclusive_start_key:
+                    break
+
+        except ClientError as gsi_query_error:
+            if gsi_query_error.response['Error']['Code'] != 'ValidationException':
+                raise
+
+            # GSI not provisioned yet (it is created manually in the console) -
+            # fall back to the old scan + in-Python sort
+            print(f"RecentItemsIndex not available, falling back to scan: {gsi_query_error}")
+
+            dynamodb_scan_parameters = {
+                'Limit': maximum_items_to_return * 2
+            }
+
+            if combined_filter_expression is not None:
+                dynamodb_scan_parameters['FilterExpression'] = combined_filter_expression
+
+            if pagination_last_evaluated_key:
+                dynamodb_scan_parameters['ExclusiveStartKey'] = json.loads(pagination_last_evaluated_key)
+
+            dynamodb_read_response = lost_and_found_items_table.scan(**dynamodb_scan_parameters)
+
+            # Only the newest N items survive the slice below, so pick them
+            # with a bounded heap instead of sorting the whole page
+            items_sorted_by_creation_date = heapq.nlargest(
+                maximum_items_to_return,
+                dynamodb_read_response.get('Items', []),
+                key=lambda item_record: item_record.get('createdAt', '') or ''
+            )
+
         response_data_with_pagination = {
             'items': items_sorted_by_creation_date[:maximum_items_to_return],
             'count': len(items_sorted_by_creation_date)
         }
-        
-        if 'LastEvaluatedKey' in dynamodb_scan_response:
+
+        if 'LastEvaluatedKey' in dynamodb_read_response:
             response_data_with_pagination['lastKey'] = json.dumps(
-                dynamodb_scan_response['LastEvaluatedKey'], 
-                cls=DynamoDBDecimalToJSONEncoder
+                dynamodb_read_response['LastEvaluatedKey'],
+                default=convert_decimal_for_json
             )
-        
+
         return response_data_with_pagination
         
     except ClientError as dynamodb_client_error:
@@ -84,22 +84,64 @@ AWS Academy Learner Lab Pattern (Standard Lambda Integration):
 - Returns messages sorted by date (newest first)
 """
 
+import heapq
 import json
 import boto3
 from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from decimal import Decimal
 import os
 
-class DynamoDBDecimalToJSONEncoder(json.JSONEncoder):
-    def default(self, decimal_object):
-        if isinstance(decimal_object, Decimal):
-            return int(decimal_object) if decimal_object % 1 == 0 else float(decimal_object)
-        return super(DynamoDBDecimalToJSONEncoder, self).default(decimal_object)
+# Shared HTTP client tuning: keep warm connections alive across invocations,
+# allow enough pooled connections for parallel calls, and use adaptive retry
+# mode so throttled requests back off with jitter
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    connect_timeout=1.0,
+    read_timeout=5.0
+)
 
-dynamodb_resource = boto3.resource('dynamodb')
+def convert_decimals_to_json_types(value):
+    """Recursively convert DynamoDB Decimal values to int/float."""
+    if isinstance(value, list):
+        return [convert_decimals_to_json_types(element) for element in value]
+    if isinstance(value, dict):
+        return {key: convert_decimals_to_json_types(element) for key, element in value.items()}
+    if isinstance(value, Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    return value
+
+dynamodb_resource = boto3.resource('dynamodb', config=botocore_client_config)
 user_to_user_messages_table_name = os.environ.get('MESSAGES_TABLE', 'FindersKeeper-Messages')
 user_to_user_messages_table = dynamodb_resource.Table(user_to_user_messages_table_name)
 
+sender_messages_index_name = os.environ.get('SENDER_INDEX', 'SenderIndex')
+
+# Serializing the whole API Gateway event to CloudWatch costs real CPU on
+# every call - only do it when explicitly debugging
+debug_logging_enabled = os.environ.get('DEBUG', '') != ''
+
+# Module-level executor so warm invocations reuse the same worker threads
+message_query_executor = ThreadPoolExecutor(max_workers=2)
+
+# Prototype for new thread records - dict.copy() of a prebuilt dict is a
+# straight memcpy in CPython, cheaper than building a 10-key literal per thread
+thread_record_template = {
+    'threadId': None,
+    'itemId': None,
+    'itemTitle': None,
+    'itemStatus': None,
+    'otherUserId': None,
+    'otherUserName': None,
+    'otherUserEmail': None,
+    'messages': None,
+    'lastMessageTime': None,
+    'unreadCount': 0
+}
+
 def lambda_handler(event, context):
     """
     GET /messages
@@ -110,91 +152,119 @@ def lambda_handler(event, context):
     
     try:
         # Debug: Print the incoming event structure
-        print(f"DEBUG - Event received: {json.dumps(event)}")
-        
+        if debug_logging_enabled:
+            print(f"DEBUG - Event received: {json.dumps(event)}")
+
         # Get user info from Cognito authorizer
         claims = event['requestContext']['authorizer']['claims']
         user_id = claims['sub']
         user_email = claims['email']
-        
-        print(f"Fetching messages for user: {user_email} ({user_id})")
+
+        if debug_logging_enabled:
+            print(f"Fetching messages for user: {user_email} ({user_id})")
         
         # Query messages where user is the recipient
-        response_recipient = user_to_user_messages_table.query(
-            IndexName='RecipientIndex',
-            KeyConditionExpression='recipientUserId = :uid',
-            ExpressionAttributeValues={
-                ':uid': user_id
-            },
-            ScanIndexForward=False  # Sort descending (newest first)
-        )
-        
-        # Query messages where user is the sender (need a SenderIndex for this)
-        # For now, we'll scan and filter - not ideal but works for AWS Academy
-        response_sender = user_to_user_messages_table.scan(
-            FilterExpression='senderUserId = :uid',
-            ExpressionAttributeValues={
-                ':uid': user_id
-            }
-        )
+        def query_received_messages():
+            return user_to_user_messages_table.query(
+                IndexName='RecipientIndex',
+                KeyConditionExpression='recipientUserId = :uid',
+                ExpressionAttributeValues={
+                    ':uid': user_id
+                },
+                ScanIndexForward=True  # Sort ascending (oldest first)
+            )
+
+        # Query messages where user is the sender via the SenderIndex GSI
+        # (falls back to the old scan if the index hasn't been created yet)
+        def query_sent_messages():
+            try:
+                return user_to_user_messages_table.query(
+                    IndexName=sender_messages_index_name,
+                    KeyConditionExpression='senderUserId = :uid',
+                    ExpressionAttributeValues={
+                        ':uid': user_id
+                    },
+                    ScanIndexForward=True
+                )
+            except ClientError as sender_index_error:
+                if sender_index_error.response['Error']['Code'] != 'ValidationException':
+                    raise
+                print(f"SenderIndex not available, falling back to scan: {sender_index_error}")
+                scan_response = user_to_user_messages_table.scan(
+                    FilterExpression='senderUserId = :uid',
+                    ExpressionAttributeValues={
+                        ':uid': user_id
+                    }
+                )
+                # Scan results are unordered - sort so the merge below works
+                scan_response.get('Items', []).sort(key=lambda m: m.get('createdAt', ''))
+                return scan_response
+
+        # Run both reads concurrently - they are independent round-trips
+        future_received = message_query_executor.submit(query_received_messages)
+        future_sent = message_query_executor.submit(query_sent_messages)
+        response_recipient = future_received.result()
+        response_sender = future_sent.result()
         
-        # Combine messages from both queries
+        # Merge the two already-sorted result sets into one chronological list
+        # (oldest first), so no per-thread sorting is needed later
         messages_received = response_recipient.get('Items', [])
         messages_sent = response_sender.get('Items', [])
-        messages = messages_received + messages_sent
+        messages = list(heapq.merge(
+            messages_received, messages_sent,
+            key=lambda m: m.get('createdAt', '')
+        ))
         
         print(f"Found {len(messages_received)} received messages and {len(messages_sent)} sent messages")
         
-        # Convert Decimal types to JSON-serializable types
-        messages = json.loads(json.dumps(messages, cls=DynamoDBDecimalToJSONEncoder))
+        # Convert Decimal types to JSON-serializable types in one pass
+        # (cheaper than a json.dumps/json.loads round-trip)
+        messages = convert_decimals_to_json_types(messages)
         
         # Group messages into conversation threads
         # Each thread is between two users about a specific item
         threads = {}
         for msg in messages:
-            # Create unique thread ID: itemId + sorted user IDs
+            # Bind the fields used below once - each .get is a hash lookup
+            # and this loop is the hottest code in the handler
             sender_id = msg.get('senderUserId', '')
             recipient_id = msg.get('recipientUserId', '')
             item_id = msg.get('itemId', '')
-            
-            # Sort user IDs to ensure consistency regardless of who sent first
-            user_ids = sorted([sender_id, recipient_id])
-            thread_id = f"{item_id}#{user_ids[0]}#{user_ids[1]}"
-            
-            if thread_id not in threads:
+            created_at = msg.get('createdAt', '')
+
+            # Order user IDs to ensure consistency regardless of who sent first
+            # (a branch is cheaper than sorting a two-element list per message)
+            first_user_id, second_user_id = (sender_id, recipient_id) if sender_id <= recipient_id else (recipient_id, sender_id)
+
+            # Group on a tuple key; the '#'-joined threadId string only needs
+            # to be built once per thread, when it first appears
+            thread_key = (item_id, first_user_id, second_user_id)
+
+            thread = threads.get(thread_key)
+            if thread is None:
+                is_other_user_the_sender = sender_id != user_id
+
+                thread = threads[thread_key] = thread_record_template.copy()
+                thread['threadId'] = f"{item_id}#{first_user_id}#{second_user_id}"
+                thread['itemId'] = item_id
+                thread['itemTitle'] = msg.get('itemTitle', 'Unknown Item')
+                thread['itemStatus'] = msg.get('itemStatus', 'unknown')
                 # Determine the "other user" in this conversation
-                other_user_id = sender_id if sender_id != user_id else recipient_id
-                other_user_name = msg.get('senderName') if sender_id != user_id else msg.get('recipientName', 'Unknown')
-                other_user_email = msg.get('senderEmail') if sender_id != user_id else msg.get('recipientEmail', '')
-                
-                threads[thread_id] = {
-                    'threadId': thread_id,
-                    'itemId': item_id,
-                    'itemTitle': msg.get('itemTitle', 'Unknown Item'),
-                    'itemStatus': msg.get('itemStatus', 'unknown'),
-                    'otherUserId': other_user_id,
-                    'otherUserName': other_user_name,
-                    'otherUserEmail': other_user_email,
-                    'messages': [],
-                    'lastMessageTime': msg.get('createdAt', ''),
-                    'unreadCount': 0
-                }
-            
-            # Add message to thread
-            threads[thread_id]['messages'].append(msg)
-            
-            # Update last message time
-            if msg.get('createdAt', '') > threads[thread_id]['lastMessageTime']:
-                threads[thread_id]['lastMessageTime'] = msg.get('createdAt', '')
-            
+                thread['otherUserId'] = sender_id if is_other_user_the_sender else recipient_id
+                thread['otherUserName'] = msg.get('senderName') if is_other_user_the_sender else msg.get('recipientName', 'Unknown')
+                thread['otherUserEmail'] = msg.get('senderEmail') if is_other_user_the_sender else msg.get('recipientEmail', '')
+                thread['messages'] = []
+                thread['lastMessageTime'] = created_at
+
+            # Add message to thread - messages arrive in chronological order,
+            # so the thread list stays sorted and this is always the latest
+            thread['messages'].append(msg)
+            thread['lastMessageTime'] = created_at
+
             # Count unread messages (messages sent TO the current user that are unread)
-            if msg.get('recipientUserId') == user_id and not msg.get('read', False):
-                threads[thread_id]['unreadCount'] += 1
-        
-        # Sort messages within each thread by time (oldest first for chat display)
-        for thread in threads.values():
-            thread['messages'].sort(key=lambda x: x.get('createdAt', ''))
-        
+            if recipient_id == user_id and not msg.get('read', False):
+                thread['unreadCount'] += 1
+
         # Convert to list and sort threads by last message time (newest first)
         thread_list = list(threads.values())
         thread_list.sort(key=lambda x: x['lastMessageTime'], reverse=True)
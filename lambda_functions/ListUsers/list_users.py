@@ -75,10 +75,130 @@ Returns:
 import json
 import boto3
 import os
+import time
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-cognito_identity_provider_client = boto3.client('cognito-idp')
+# Shared HTTP client tuning: keep warm connections alive across invocations,
+# allow enough pooled connections for the parallel group lookups, and use
+# adaptive retry mode so throttled requests back off with jitter
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    connect_timeout=1.0,
+    read_timeout=5.0
+)
+
+cognito_identity_provider_client = boto3.client(
+    'cognito-idp',
+    config=botocore_client_config
+)
 cognito_user_pool_identifier = os.environ.get('USER_POOL_ID', 'us-east-1_kfNTDWsQD')
+admin_group_name = os.environ.get('ADMIN_GROUP', 'Admins')
+
+# Serializing the whole API Gateway event to CloudWatch costs real CPU on
+# every call - only do it when explicitly debugging
+debug_logging_enabled = os.environ.get('DEBUG', '') != ''
+
+# Per-container cache of group memberships parsed from the JWT, keyed by sub.
+# Bounded by the token's exp (capped at 60s) so revoked admins expire with
+# their token; saves re-splitting the claim when the same admin hits in bursts.
+cached_group_memberships_by_user_sub = {}
+
+def get_cached_group_memberships(cognito_user_claims):
+    user_sub = cognito_user_claims.get('sub')
+    current_time = time.time()
+
+    cached_entry = cached_group_memberships_by_user_sub.get(user_sub)
+    if cached_entry and cached_entry[1] > current_time:
+        return cached_entry[0]
+
+    raw_group_claim = cognito_user_claims.get('cognito:groups') or ''
+    if isinstance(raw_group_claim, str):
+        group_memberships = frozenset(raw_group_claim.split(',')) if raw_group_claim else frozenset()
+    else:
+        group_memberships = frozenset(raw_group_claim)
+
+    if user_sub:
+        token_expiry_epoch = int(cognito_user_claims.get('exp', 0))
+        cache_entry_expires_at = min(token_expiry_epoch or current_time + 60, current_time + 60)
+        if len(cached_group_memberships_by_user_sub) > 256:
+            cached_group_memberships_by_user_sub.pop(next(iter(cached_group_memberships_by_user_sub)))
+        cached_group_memberships_by_user_sub[user_sub] = (group_memberships, cache_entry_expires_at)
+
+    return group_memberships
+
+def fetch_group_names_for_single_user(cognito_username):
+    groups_response = cognito_identity_provider_client.admin_list_groups_for_user(
+        UserPoolId=cognito_user_pool_identifier,
+        Username=cognito_username
+    )
+    return [group['GroupName'] for group in groups_response.get('Groups', [])]
+
+# Module-level executor so warm invocations reuse the same worker threads
+group_lookup_executor = ThreadPoolExecutor(max_workers=20)
+
+def iterate_formatted_cognito_user_pages():
+    """Generator yielding one fully-formatted page of users (max 60) at a time.
+
+    Only a single Cognito page is held as raw API output at any moment, so
+    peak working memory stays bounded by the page size rather than the pool
+    size. Group memberships for each page are resolved in parallel before the
+    page is yielded.
+    """
+    cognito_pagination_token = None
+
+    while True:
+        cognito_list_users_parameters = {
+            'UserPoolId': cognito_user_pool_identifier,
+            'Limit': 60
+        }
+
+        if cognito_pagination_token:
+            cognito_list_users_parameters['PaginationToken'] = cognito_pagination_token
+
+        cognito_list_users_response = cognito_identity_provider_client.list_users(**cognito_list_users_parameters)
+
+        formatted_user_page = []
+        for user_record_from_cognito in cognito_list_users_response.get('Users', []):
+            formatted_user_data = {
+                'username': user_record_from_cognito['Username'],
+                'created': user_record_from_cognito['UserCreateDate'].isoformat(),
+                'status': user_record_from_cognito['UserStatus'],
+                'enabled': user_record_from_cognito['Enabled']
+            }
+
+            for user_attribute in user_record_from_cognito.get('Attributes', []):
+                if user_attribute['Name'] == 'email':
+                    formatted_user_data['email'] = user_attribute['Value']
+                elif user_attribute['Name'] == 'name':
+                    formatted_user_data['name'] = user_attribute['Value']
+                elif user_attribute['Name'] == 'email_verified':
+                    formatted_user_data['emailVerified'] = user_attribute['Value'] == 'true'
+
+            formatted_user_page.append(formatted_user_data)
+
+        # Cognito has no batch "list groups for many users" API, so fetch the
+        # group memberships for this page in parallel
+        pending_group_lookups = {
+            group_lookup_executor.submit(fetch_group_names_for_single_user, user_data['username']): user_data
+            for user_data in formatted_user_page
+        }
+        for completed_lookup in as_completed(pending_group_lookups):
+            user_data = pending_group_lookups[completed_lookup]
+            try:
+                user_data['groups'] = completed_lookup.result()
+            except Exception as group_error:
+                print(f"Could not get groups for user {user_data['username']}: {group_error}")
+                user_data['groups'] = []
+
+        yield formatted_user_page
+
+        cognito_pagination_token = cognito_list_users_response.get('PaginationToken')
+        if not cognito_pagination_token:
+            break
 
 def retrieve_all_cognito_users_for_admin_panel(api_gateway_event, lambda_context):
     """
@@ -89,69 +209,28 @@ def retrieve_all_cognito_users_for_admin_panel(api_gateway_event, lambda_context
     """
     
     try:
-        print(f"Event: {json.dumps(api_gateway_event)}")
-        
+        # Admin check first so unauthorized callers fail before any other work
         cognito_user_claims_from_authorizer = {}
         if 'requestContext' in api_gateway_event and 'authorizer' in api_gateway_event['requestContext']:
             cognito_user_claims_from_authorizer = api_gateway_event['requestContext'].get('authorizer', {}).get('claims', {})
-        
-        authenticated_user_group_memberships = cognito_user_claims_from_authorizer.get('cognito:groups', '')
-        
-        if isinstance(authenticated_user_group_memberships, str):
-            authenticated_user_group_memberships = authenticated_user_group_memberships.split(',') if authenticated_user_group_memberships else []
-        current_user_has_admin_role = 'Admins' in authenticated_user_group_memberships
-        
+
+        current_user_has_admin_role = admin_group_name in get_cached_group_memberships(cognito_user_claims_from_authorizer)
+
         if not current_user_has_admin_role:
             raise Exception('Admin privileges required')
+
+        if debug_logging_enabled:
+            print(f"Event: {json.dumps(api_gateway_event)}")
         
+        # Consume the pool page by page. API Gateway's standard Lambda
+        # integration needs one JSON array back, so the pages are still
+        # collected here - but only formatted dicts accumulate, and group
+        # lookups overlap with pagination instead of running in one big
+        # pass at the end.
         all_cognito_users_list = []
-        cognito_pagination_token = None
-        
-        while True:
-            cognito_list_users_parameters = {
-                'UserPoolId': cognito_user_pool_identifier,
-                'Limit': 60
-            }
-            
-            if cognito_pagination_token:
-                cognito_list_users_parameters['PaginationToken'] = cognito_pagination_token
-            
-            cognito_list_users_response = cognito_identity_provider_client.list_users(**cognito_list_users_parameters)
-            
-            for user_record_from_cognito in cognito_list_users_response.get('Users', []):
-                formatted_user_data = {
-                    'username': user_record_from_cognito['Username'],
-                    'created': user_record_from_cognito['UserCreateDate'].isoformat(),
-                    'status': user_record_from_cognito['UserStatus'],
-                    'enabled': user_record_from_cognito['Enabled']
-                }
-                
-                for user_attribute in user_record_from_cognito.get('Attributes', []):
-                    if user_attribute['Name'] == 'email':
-                        formatted_user_data['email'] = user_attribute['Value']
-                    elif user_attribute['Name'] == 'name':
-                        formatted_user_data['name'] = user_attribute['Value']
-                    elif user_attribute['Name'] == 'email_verified':
-                        formatted_user_data['emailVerified'] = user_attribute['Value'] == 'true'
-                
-                # Get user groups
-                try:
-                    groups_response = cognito_identity_provider_client.admin_list_groups_for_user(
-                        UserPoolId=cognito_user_pool_identifier,
-                        Username=user_record_from_cognito['Username']
-                    )
-                    user_groups = [group['GroupName'] for group in groups_response.get('Groups', [])]
-                    formatted_user_data['groups'] = user_groups
-                except Exception as group_error:
-                    print(f"Could not get groups for user {user_record_from_cognito['Username']}: {group_error}")
-                    formatted_user_data['groups'] = []
-                
-                all_cognito_users_list.append(formatted_user_data)
-            
-            cognito_pagination_token = cognito_list_users_response.get('PaginationToken')
-            if not cognito_pagination_token:
-                break
-        
+        for formatted_user_page in iterate_formatted_cognito_user_pages():
+            all_cognito_users_list.extend(formatted_user_page)
+
         print(f"✅ Retrieved {len(all_cognito_users_list)} users")
         
         return all_cognito_users_list
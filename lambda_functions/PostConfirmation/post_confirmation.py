@@ -1,5 +1,18 @@
-import boto3
-import json
+# boto3 is imported lazily on first use: this trigger sits on the user-visible
+# signup path, so the cold start should not pay the full SDK import up front.
+# The client is still cached at module level so warm invocations reuse it.
+cognito_client = None
+
+def get_cognito_client():
+    global cognito_client
+    if cognito_client is None:
+        import boto3
+        from botocore.config import Config
+        cognito_client = boto3.client(
+            'cognito-idp',
+            config=Config(tcp_keepalive=True, retries={'max_attempts': 3, 'mode': 'standard'})
+        )
+    return cognito_client
 
 def lambda_handler(event, context):
     """
@@ -64,11 +77,8 @@ def lambda_handler(event, context):
         user_pool_id = event['userPoolId']
         username = event['userName']
         
-        # Initialize Cognito client
-        cognito_client = boto3.client('cognito-idp')
-        
         # Add user to 'Users' group
-        cognito_client.admin_add_user_to_group(
+        get_cognito_client().admin_add_user_to_group(
             UserPoolId=user_pool_id,
             Username=username,
             GroupName='Users'
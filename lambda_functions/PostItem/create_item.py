@@ -98,59 +98,223 @@ AWS Academy Learner Lab Pattern:
 """
 
 import json
-import boto3
+import re
+import botocore.session
+from botocore.config import Config
 from botocore.exceptions import ClientError
-import uuid
 import base64
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime
 import os
 
-dynamodb_resource = boto3.resource('dynamodb')
-s3_client_for_image_uploads = boto3.client('s3')
+# pybase64 decodes with SIMD kernels at near-memcpy speed; use it when the
+# deployment package/layer ships it, otherwise fall back to the stdlib decoder
+try:
+    import pybase64
+    base64_decode = pybase64.b64decode
+except ImportError:
+    base64_decode = base64.b64decode
+
+# orjson parses request bodies several times faster than stdlib json; same
+# optional-layer pattern as pybase64 above
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Single regex scan + dict lookup instead of a chain of substring checks
+# against the data URI header (up to 5 scans of the header per upload)
+supported_image_mime_type_pattern = re.compile(r'image/(jpeg|jpg|png|gif|webp)')
+content_type_and_extension_by_mime_subtype = {
+    'jpeg': ('image/jpeg', 'jpg'),
+    'jpg': ('image/jpeg', 'jpg'),
+    'png': ('image/png', 'png'),
+    'gif': ('image/gif', 'gif'),
+    'webp': ('image/webp', 'webp')
+}
+
+# Keep warm connections alive across invocations and allow concurrent
+# S3 + DynamoDB calls from one container without pool starvation
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'standard'}
+)
+
+# Largest decoded image accepted; anything bigger would also risk tipping
+# over a small-memory Lambda before the S3 PUT even starts
+maximum_decoded_image_size_bytes = 8 * 1024 * 1024
+
+# Bodies at or above this size upload as multipart parts so sigv4 signs
+# smaller chunks instead of hashing the whole body in one pass (5 MiB is
+# also S3's minimum non-final part size)
+multipart_upload_threshold_bytes = 5 * 1024 * 1024
+
+# Low-level botocore clients skip boto3's default-session and resource
+# machinery on cold start; only the S3 and DynamoDB service models load.
+# Every field in the item schema is a string, so the put_item payload is
+# built with literal {'S': value} wraps - no serializer dispatch at all.
+botocore_shared_session = botocore.session.Session()
+dynamodb_client = botocore_shared_session.create_client('dynamodb', config=botocore_client_config)
+s3_client_for_image_uploads = botocore_shared_session.create_client('s3', config=botocore_client_config)
+
+# Module-level executor so warm invocations reuse the same worker threads;
+# boto3 clients are thread-safe for independent operations
+parallel_write_executor = ThreadPoolExecutor(max_workers=2)
 lost_and_found_items_table_name = os.environ.get('ITEMS_TABLE', 'FindersKeeper-Items')
 public_image_storage_bucket_name = os.environ.get('IMAGE_BUCKET', 'finders-keeper-images')
-lost_and_found_items_table = dynamodb_resource.Table(lost_and_found_items_table_name)
+
+def generate_uuid4_formatted_identifier():
+    """RFC 4122 v4 id straight from os.urandom, skipping the uuid.UUID
+    object and its str() call. Keeps the dashed format that existing item
+    ids (and the S3 keys and URLs built from them) already use."""
+    random_bytes = bytearray(os.urandom(16))
+    random_bytes[6] = (random_bytes[6] & 0x0F) | 0x40
+    random_bytes[8] = (random_bytes[8] & 0x3F) | 0x80
+    hex_digits = bytes(random_bytes).hex()
+    return f"{hex_digits[:8]}-{hex_digits[8:12]}-{hex_digits[12:16]}-{hex_digits[16:20]}-{hex_digits[20:]}"
 
 def validate_required_item_fields_and_constraints(item_data_from_request):
-    required_field_names = ['title', 'status', 'location', 'date', 'category', 'description']
-    
-    for field_name in required_field_names:
-        if field_name not in item_data_from_request or not item_data_from_request[field_name]:
-            raise ValueError(f"Missing required field: {field_name}")
-    
-    if item_data_from_request['status'] not in ['lost', 'found']:
+    # The schema is small and fixed, so straight-line .get() checks beat a
+    # loop over field names: one dict lookup per field instead of a
+    # membership test plus a second lookup, and the length checks reuse the
+    # locals already fetched
+    title_text = item_data_from_request.get('title')
+    if not title_text:
+        raise ValueError("Missing required field: title")
+
+    status_value = item_data_from_request.get('status')
+    if not status_value:
+        raise ValueError("Missing required field: status")
+
+    location_text = item_data_from_request.get('location')
+    if not location_text:
+        raise ValueError("Missing required field: location")
+
+    if not item_data_from_request.get('date'):
+        raise ValueError("Missing required field: date")
+
+    if not item_data_from_request.get('category'):
+        raise ValueError("Missing required field: category")
+
+    description_text = item_data_from_request.get('description')
+    if not description_text:
+        raise ValueError("Missing required field: description")
+
+    if status_value != 'lost' and status_value != 'found':
         raise ValueError("Status must be 'lost' or 'found'")
-    
-    title_text_length = len(item_data_from_request['title'])
+
+    title_text_length = len(title_text)
     if title_text_length < 3 or title_text_length > 100:
         raise ValueError("Title must be between 3 and 100 characters")
-    
-    location_text_length = len(item_data_from_request['location'])
+
+    location_text_length = len(location_text)
     if location_text_length < 3 or location_text_length > 100:
         raise ValueError("Location must be between 3 and 100 characters")
-    
-    if len(item_data_from_request['description']) > 500:
+
+    if len(description_text) > 500:
         raise ValueError("Description must be less than 500 characters")
-    
+
     return True
 
-def upload_base64_encoded_image_to_s3_and_return_public_url(base64_image_string, unique_item_identifier, authenticated_user_id):
+def issue_presigned_image_upload_url(request_body_data):
+    """First leg of the direct-upload contract: hand the browser a presigned
+    PUT URL so the raw image bytes go straight to S3.
+
+    This keeps the image off the Lambda entirely - no base64 inflation
+    (~33% extra payload through API Gateway), no decode CPU and no relayed
+    PUT. The client then posts the item with the returned imageKey, which
+    the main path below turns into the public URL.
+    """
+    requested_content_type = request_body_data.get('imageContentType', 'image/jpeg')
+    mime_type_match = supported_image_mime_type_pattern.search(requested_content_type)
+    if mime_type_match:
+        http_content_type, file_extension = content_type_and_extension_by_mime_subtype[mime_type_match.group(1)]
+    else:
+        http_content_type = 'image/jpeg'
+        file_extension = 'jpg'
+
+    utc_timestamp_for_filename = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+    s3_object_key_for_image = f"items/{generate_uuid4_formatted_identifier()}-{utc_timestamp_for_filename}.{file_extension}"
+
+    presigned_put_url = s3_client_for_image_uploads.generate_presigned_url(
+        'put_object',
+        Params={
+            'Bucket': public_image_storage_bucket_name,
+            'Key': s3_object_key_for_image,
+            'ContentType': http_content_type
+        },
+        ExpiresIn=300
+    )
+
+    return {
+        'success': True,
+        'uploadUrl': presigned_put_url,
+        'imageKey': s3_object_key_for_image,
+        'contentType': http_content_type
+    }
+
+
+def execute_s3_image_upload(s3_put_object_request):
+    """Send a prepared image body to S3, as a single PUT for small images or
+    a multipart upload above the 5 MiB threshold.
+
+    Multipart keeps each SHA-256 payload hash to one part's worth of bytes
+    and leaves room to parallelize parts later; with the 8 MiB request cap
+    an upload is at most two parts, so parts go up sequentially for now.
+    """
+    image_body = s3_put_object_request['Body']
+    if len(image_body) < multipart_upload_threshold_bytes:
+        s3_client_for_image_uploads.put_object(**s3_put_object_request)
+        return
+
+    bucket_name = s3_put_object_request['Bucket']
+    object_key = s3_put_object_request['Key']
+    multipart_upload = s3_client_for_image_uploads.create_multipart_upload(
+        Bucket=bucket_name,
+        Key=object_key,
+        ContentType=s3_put_object_request['ContentType']
+    )
+    multipart_upload_id = multipart_upload['UploadId']
+
     try:
-        if ',' in base64_image_string:
-            data_uri_header, base64_encoded_data = base64_image_string.split(',', 1)
-            
-            if 'image/jpeg' in data_uri_header or 'image/jpg' in data_uri_header:
-                http_content_type = 'image/jpeg'
-                file_extension = 'jpg'
-            elif 'image/png' in data_uri_header:
-                http_content_type = 'image/png'
-                file_extension = 'png'
-            elif 'image/gif' in data_uri_header:
-                http_content_type = 'image/gif'
-                file_extension = 'gif'
-            elif 'image/webp' in data_uri_header:
-                http_content_type = 'image/webp'
-                file_extension = 'webp'
+        completed_parts = []
+        for part_number, part_offset in enumerate(
+                range(0, len(image_body), multipart_upload_threshold_bytes), start=1):
+            part_response = s3_client_for_image_uploads.upload_part(
+                Bucket=bucket_name,
+                Key=object_key,
+                PartNumber=part_number,
+                UploadId=multipart_upload_id,
+                Body=image_body[part_offset:part_offset + multipart_upload_threshold_bytes]
+            )
+            completed_parts.append({'ETag': part_response['ETag'], 'PartNumber': part_number})
+
+        s3_client_for_image_uploads.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=object_key,
+            UploadId=multipart_upload_id,
+            MultipartUpload={'Parts': completed_parts}
+        )
+    except Exception:
+        # Abort so incomplete parts don't accumulate storage charges
+        s3_client_for_image_uploads.abort_multipart_upload(
+            Bucket=bucket_name, Key=object_key, UploadId=multipart_upload_id)
+        raise
+
+
+def prepare_s3_image_upload_request_and_public_url(base64_image_string, unique_item_identifier, timestamp_for_filename):
+    """Decode the data URI and build the put_object arguments plus the final
+    public URL. The URL is deterministic from bucket + key, so the caller can
+    write the DynamoDB record while the S3 PUT is still in flight."""
+    try:
+        # partition() avoids building a list just to unpack two pieces
+        data_uri_header, data_uri_separator, base64_encoded_data = base64_image_string.partition(',')
+        if data_uri_separator:
+            mime_type_match = supported_image_mime_type_pattern.search(data_uri_header)
+            if mime_type_match:
+                http_content_type, file_extension = content_type_and_extension_by_mime_subtype[mime_type_match.group(1)]
             else:
                 http_content_type = 'image/jpeg'
                 file_extension = 'jpg'
@@ -158,31 +322,54 @@ def upload_base64_encoded_image_to_s3_and_return_public_url(base64_image_string,
             base64_encoded_data = base64_image_string
             http_content_type = 'image/jpeg'
             file_extension = 'jpg'
+
+        # Decoded size is exactly 3/4 of the encoded length, so oversize
+        # uploads can be rejected before any decode buffer is allocated
+        predicted_decoded_size_bytes = (len(base64_encoded_data) * 3) >> 2
+        if predicted_decoded_size_bytes > maximum_decoded_image_size_bytes:
+            raise ValueError(
+                f"Image too large ({predicted_decoded_size_bytes // (1024 * 1024)} MB, max "
+                f"{maximum_decoded_image_size_bytes // (1024 * 1024)} MB)")
+
+        decoded_image_binary_data = base64_decode(base64_encoded_data)
+
+        # Drop the encoded copies as soon as the binary exists - for a 5 MB
+        # image that's ~7 MB of strings we don't want alive during the PUT
+        del base64_encoded_data
+        del base64_image_string
         
-        decoded_image_binary_data = base64.b64decode(base64_encoded_data)
-        
-        utc_timestamp_for_filename = datetime.utcnow().strftime('%Y%m%d%H%M%S')
-        s3_object_key_for_image = f"items/{unique_item_identifier}-{utc_timestamp_for_filename}.{file_extension}"
-        
-        s3_client_for_image_uploads.put_object(
-            Bucket=public_image_storage_bucket_name,
-            Key=s3_object_key_for_image,
-            Body=decoded_image_binary_data,
-            ContentType=http_content_type,
-            Metadata={
-                'uploaded-by': authenticated_user_id,
-                'upload-date': datetime.utcnow().isoformat()
-            }
-        )
-        
+        s3_object_key_for_image = f"items/{unique_item_identifier}-{timestamp_for_filename}.{file_extension}"
+
+        # No Metadata block: the uploader and upload date already live on the
+        # DynamoDB row (userId/createdAt), and x-amz-meta-* headers inflate
+        # the signed request for every PUT
+        s3_put_object_request = {
+            'Bucket': public_image_storage_bucket_name,
+            'Key': s3_object_key_for_image,
+            'Body': decoded_image_binary_data,
+            'ContentType': http_content_type
+        }
+
         publicly_accessible_image_url = f"https://{public_image_storage_bucket_name}.s3.amazonaws.com/{s3_object_key_for_image}"
-        return publicly_accessible_image_url
-        
+        return s3_put_object_request, publicly_accessible_image_url
+
     except Exception as image_upload_exception:
-        print(f"Error uploading image to S3: {str(image_upload_exception)}")
+        print(f"Error preparing image upload: {str(image_upload_exception)}")
         raise ValueError(f"Failed to upload image: {str(image_upload_exception)}")
 
 
+# One except clause with a dispatch table replaces the old four-deep
+# except chain: CPython tests every except type in turn on each raise, so
+# the common error paths now do a single isinstance scan and a single
+# translation. The Exception entry is last and doubles as the fallback.
+error_translation_by_exception_type = {
+    ValueError: ('Validation error', lambda caught_error: Exception(f"Validation error: {str(caught_error)}")),
+    KeyError: ('Missing required field', lambda caught_error: Exception("Unauthorized: Valid authentication required")),
+    ClientError: ('AWS error', lambda caught_error: Exception(f"Database error: {caught_error.response['Error']['Message']}")),
+    Exception: ('Unexpected error', lambda caught_error: Exception(f"Internal server error: {str(caught_error)}")),
+}
+
+
 def create_new_lost_or_found_item_with_image_upload(api_gateway_event, lambda_context):
     """
     POST /items
@@ -206,33 +393,56 @@ def create_new_lost_or_found_item_with_image_upload(api_gateway_event, lambda_co
     """
     
     try:
-        request_body_data = api_gateway_event.get('body', {})
-        if isinstance(request_body_data, str):
-            request_body_data = json.loads(request_body_data)
-        
+        # Resolve the caller's identity before spending any CPU parsing the
+        # body - unauthorized requests fail on the cheap dict lookup
         cognito_user_claims = api_gateway_event['requestContext']['authorizer']['claims']
         authenticated_user_unique_id = cognito_user_claims['sub']
         authenticated_user_email_address = cognito_user_claims['email']
-        authenticated_user_display_name = cognito_user_claims.get('name', authenticated_user_email_address.split('@')[0])
-        
+
+        request_body_data = api_gateway_event.get('body', {})
+        if isinstance(request_body_data, str):
+            request_body_data = json_loads(request_body_data)
+        authenticated_user_display_name = cognito_user_claims.get('name') or authenticated_user_email_address.partition('@')[0]
+
+        # Direct-upload first leg: the client only wants a presigned PUT URL
+        if request_body_data.get('requestUploadUrl'):
+            return issue_presigned_image_upload_url(request_body_data)
+
         validate_required_item_fields_and_constraints(request_body_data)
         
-        generated_unique_item_id = str(uuid.uuid4())
-        
+        generated_unique_item_id = generate_uuid4_formatted_identifier()
+
+        # One clock read per invocation - the S3 object metadata, the S3 key
+        # and the createdAt/updatedAt fields all derive from the same instant
+        current_utc_time = datetime.utcnow()
+        # strftime emits the trailing Z in one allocation instead of the
+        # isoformat() + 'Z' intermediate-string concat
+        current_utc_timestamp_iso_format = current_utc_time.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        utc_timestamp_for_filename = current_utc_time.strftime('%Y%m%d%H%M%S')
+
         publicly_accessible_image_url = ''
-        if 'imageBase64' in request_body_data and request_body_data['imageBase64']:
+        s3_put_object_request = None
+        # pop() releases the request dict's reference to the base64 payload so
+        # it can be freed as soon as the decode step is done with it
+        base64_image_payload = request_body_data.pop('imageBase64', None)
+        if base64_image_payload:
             print(f"Uploading image for item {generated_unique_item_id}...")
-            publicly_accessible_image_url = upload_base64_encoded_image_to_s3_and_return_public_url(
-                request_body_data['imageBase64'], 
-                generated_unique_item_id, 
-                authenticated_user_unique_id
+            s3_put_object_request, publicly_accessible_image_url = prepare_s3_image_upload_request_and_public_url(
+                base64_image_payload,
+                generated_unique_item_id,
+                utc_timestamp_for_filename
             )
-            print(f"Image uploaded successfully: {publicly_accessible_image_url}")
+            del base64_image_payload
+        elif request_body_data.get('imageKey'):
+            # Direct-upload second leg: the browser already PUT the binary to
+            # S3 via a presigned URL, so only the public URL is derived here
+            uploaded_image_object_key = request_body_data['imageKey']
+            if not uploaded_image_object_key.startswith('items/'):
+                raise ValueError("Invalid imageKey")
+            publicly_accessible_image_url = f"https://{public_image_storage_bucket_name}.s3.amazonaws.com/{uploaded_image_object_key}"
         elif 'img' in request_body_data and request_body_data['img']:
             publicly_accessible_image_url = request_body_data['img']
-        
-        current_utc_timestamp_iso_format = datetime.utcnow().isoformat() + 'Z'
-        
+
         new_item_record_for_database = {
             'id': generated_unique_item_id,
             'title': request_body_data['title'],
@@ -247,11 +457,59 @@ def create_new_lost_or_found_item_with_image_upload(api_gateway_event, lambda_co
             'userEmail': authenticated_user_email_address,
             'userName': authenticated_user_display_name,
             'createdAt': current_utc_timestamp_iso_format,
-            'updatedAt': current_utc_timestamp_iso_format
+            'updatedAt': current_utc_timestamp_iso_format,
+            'gsiBucket': 'ALL'  # constant partition key for the RecentItemsIndex GSI
         }
-        
-        lost_and_found_items_table.put_item(Item=new_item_record_for_database)
-        
+
+        # Every field in the item schema is a string, so wrap each value
+        # literally instead of going through a generic TypeSerializer.
+        # color is the one unvalidated pass-through field - coerce a stray
+        # null or number rather than letting put_item reject the record
+        new_item_record_attribute_values = {
+            field_name: {'S': field_value if isinstance(field_value, str)
+                         else '' if field_value is None else str(field_value)}
+            for field_name, field_value in new_item_record_for_database.items()
+        }
+
+        if s3_put_object_request is not None:
+            # The S3 PUT and the DynamoDB write are independent round-trips
+            # dominated by RTT - run them concurrently
+            s3_upload_future = parallel_write_executor.submit(
+                execute_s3_image_upload, s3_put_object_request)
+            dynamodb_write_future = parallel_write_executor.submit(
+                dynamodb_client.put_item,
+                TableName=lost_and_found_items_table_name,
+                Item=new_item_record_attribute_values)
+            wait([s3_upload_future, dynamodb_write_future], return_when=FIRST_EXCEPTION)
+
+            try:
+                s3_upload_future.result()
+            except Exception as image_upload_exception:
+                print(f"Error uploading image to S3: {str(image_upload_exception)}")
+                # Compensate: if the concurrent DynamoDB write landed, the
+                # table now holds a visible item pointing at an image that
+                # will never exist (and a retry would create a duplicate) -
+                # delete it before surfacing the upload failure
+                try:
+                    dynamodb_write_future.result()
+                except Exception:
+                    pass  # write failed too; nothing to roll back
+                else:
+                    try:
+                        dynamodb_client.delete_item(
+                            TableName=lost_and_found_items_table_name,
+                            Key={'id': {'S': generated_unique_item_id}})
+                        print(f"Rolled back item record {generated_unique_item_id} after failed upload")
+                    except Exception as rollback_exception:
+                        print(f"Could not roll back item record {generated_unique_item_id}: {str(rollback_exception)}")
+                raise ValueError(f"Failed to upload image: {str(image_upload_exception)}")
+            dynamodb_write_future.result()
+            print(f"Image uploaded successfully: {publicly_accessible_image_url}")
+        else:
+            dynamodb_client.put_item(
+                TableName=lost_and_found_items_table_name,
+                Item=new_item_record_attribute_values)
+
         return {
             'success': True,
             'id': generated_unique_item_id,
@@ -259,23 +517,11 @@ def create_new_lost_or_found_item_with_image_upload(api_gateway_event, lambda_co
             'message': 'Item created successfully'
         }
         
-    except ValueError as validation_error:
-        print(f"Validation error: {str(validation_error)}")
-        raise Exception(f"Validation error: {str(validation_error)}")
-        
-    except KeyError as missing_field_error:
-        print(f"Missing required field: {str(missing_field_error)}")
-        raise Exception("Unauthorized: Valid authentication required")
-        
-    except ClientError as aws_service_error:
-        error_code_from_aws = aws_service_error.response['Error']['Code']
-        error_message_from_aws = aws_service_error.response['Error']['Message']
-        print(f"AWS Error [{error_code_from_aws}]: {error_message_from_aws}")
-        raise Exception(f"Database error: {error_message_from_aws}")
-        
-    except Exception as unexpected_exception:
-        print(f"Unexpected error: {str(unexpected_exception)}")
-        raise Exception(f"Internal server error: {str(unexpected_exception)}")
+    except Exception as caught_error:
+        for exception_type, (log_label, translate_error) in error_translation_by_exception_type.items():
+            if isinstance(caught_error, exception_type):
+                print(f"{log_label}: {str(caught_error)}")
+                raise translate_error(caught_error) from caught_error
 
 lambda_handler = create_new_lost_or_found_item_with_image_upload
 
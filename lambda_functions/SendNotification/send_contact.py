@@ -94,23 +94,214 @@ AWS Academy Workaround:
 """
 
 import json
-import boto3
+import botocore.session
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import os
+import time
 from datetime import datetime
-import uuid
+from functools import lru_cache
 
-dynamodb_resource = boto3.resource('dynamodb')
-sns_notification_client = boto3.client('sns')
+# orjson parses request bodies several times faster than stdlib json; used
+# when the deployment package/layer ships it, stdlib otherwise
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
-lost_and_found_items_table_name = os.environ.get('ITEMS_TABLE', 'FindersKeeper-Items')
-lost_and_found_items_table = dynamodb_resource.Table(lost_and_found_items_table_name)
+# Keep warm connections alive across invocations and allow concurrent
+# calls from one container without pool starvation
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'standard'}
+)
+
+# Low-level client skips the resource layer's per-call marshalling; the
+# message schema is fixed, so AttributeValue wraps are written literally in
+# convert_message_record_to_attribute_values below
+botocore_shared_session = botocore.session.Session()
+dynamodb_client = botocore_shared_session.create_client('dynamodb', config=botocore_client_config)
 
+lost_and_found_items_table_name = os.environ.get('ITEMS_TABLE', 'FindersKeeper-Items')
 user_to_user_messages_table_name = os.environ.get('MESSAGES_TABLE', 'FindersKeeper-Messages')
-user_to_user_messages_table = dynamodb_resource.Table(user_to_user_messages_table_name)
 
 application_website_base_url = os.environ.get('WEBSITE_URL', 'https://finderskeeper.com')
-sns_topic_arn_for_contact_notifications = os.environ.get('SNS_TOPIC_ARN', '')
+
+def generate_uuid4_formatted_id():
+    """RFC 4122 v4 id straight from os.urandom, skipping the uuid.UUID
+    object allocation. Keeps the dashed format existing message ids use."""
+    random_bytes = bytearray(os.urandom(16))
+    random_bytes[6] = (random_bytes[6] & 0x0F) | 0x40
+    random_bytes[8] = (random_bytes[8] & 0x3F) | 0x80
+    hex_digits = bytes(random_bytes).hex()
+    return f"{hex_digits[:8]}-{hex_digits[8:12]}-{hex_digits[12:16]}-{hex_digits[16:20]}-{hex_digits[20:]}"
+
+@lru_cache(maxsize=1024)
+def get_cached_item_owner_fields(item_id):
+    """Fetch the owner/title/status fields for an item, cached per warm
+    container.
+
+    Bursts of contacts about the same item (a popular listing) hit DynamoDB
+    once instead of once per message. Owner and title effectively never
+    change, and a slightly stale status on the message snapshot is
+    acceptable. Misses aren't cached - lru_cache doesn't store raised
+    exceptions, so an item created later is still found.
+    """
+    # Project only the five fields the message record needs instead of
+    # pulling the whole item (which can include a large description and
+    # image URL)
+    response = dynamodb_client.get_item(
+        TableName=lost_and_found_items_table_name,
+        Key={'id': {'S': item_id}},
+        # status and title are both DynamoDB reserved keywords, so both
+        # need expression aliases; the response still uses the real names
+        ProjectionExpression='userEmail,userName,userId,#t,#s',
+        ExpressionAttributeNames={'#s': 'status', '#t': 'title'}
+    )
+
+    if 'Item' not in response:
+        raise ValueError('Item not found')
+
+    # Every projected field is a plain string attribute
+    return {name: value.get('S', '') for name, value in response['Item'].items()}
+
+def build_contact_message_record(body, sender_user_id, sender_email, sender_name):
+    """Validate a contact request and build the Messages-table record.
+
+    Shared by the API Gateway path and the SQS batch path below.
+    Raises ValueError on any validation failure.
+    """
+    required_fields = ['itemId', 'message']
+    for field in required_fields:
+        if field not in body or not body[field]:
+            raise ValueError(f"Missing required field: {field}")
+
+    item_id = body['itemId']
+    message = body['message']
+
+    # Validate message length
+    if len(message) > 1000:
+        raise ValueError("Message must be less than 1000 characters")
+
+    item = get_cached_item_owner_fields(item_id)
+    owner_email = item.get('userEmail')
+    owner_name = item.get('userName', 'Item Owner')
+
+    # Don't allow contacting yourself
+    if owner_email == sender_email:
+        raise ValueError('You cannot contact yourself')
+
+    message_id = generate_uuid4_formatted_id()
+    # strftime emits the trailing Z in one allocation instead of the
+    # isoformat() + 'Z' intermediate-string concat
+    timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+    # Deterministic thread key (item + ordered user pair) - the ThreadIndex
+    # GSI on this attribute lets SendReply find the conversation in one query
+    owner_user_id = item['userId']
+    if sender_user_id <= owner_user_id:
+        thread_identifier = f"{item_id}#{sender_user_id}#{owner_user_id}"
+    else:
+        thread_identifier = f"{item_id}#{owner_user_id}#{sender_user_id}"
+
+    return {
+        'id': message_id,
+        'threadId': thread_identifier,
+        'itemId': item_id,
+        'itemTitle': item['title'],
+        'itemStatus': item['status'],
+        'recipientUserId': item['userId'],
+        'recipientEmail': owner_email,
+        'recipientName': owner_name,
+        'senderUserId': sender_user_id,
+        'senderEmail': sender_email,
+        'senderName': sender_name,
+        'message': message,
+        'createdAt': timestamp,
+        'read': False
+    }
+
+def convert_message_record_to_attribute_values(message_record):
+    """Every field in the message schema is a string except the read flag,
+    so literal AttributeValue wraps replace the resource layer's generic
+    isinstance dispatch."""
+    attribute_values = {
+        name: {'S': value}
+        for name, value in message_record.items() if name != 'read'
+    }
+    attribute_values['read'] = {'BOOL': message_record['read']}
+    return attribute_values
+
+def store_contact_messages_from_sqs_batch(sqs_records):
+    """SQS fan-in path: BatchWriteItem amortizes one round-trip over up to
+    25 records instead of one put_item per message.
+
+    Each record body carries the same JSON as the API path plus the sender's
+    identity fields (there is no Cognito authorizer in front of a queue).
+    Invalid records are skipped so one bad message doesn't poison the batch.
+    """
+    stored_message_ids = []
+    pending_put_requests = []
+    pending_message_ids = []
+    for sqs_record in sqs_records:
+        # JSON decode errors are ValueError subclasses in stdlib json and
+        # orjson alike, so a malformed body is skipped like any other
+        # invalid record instead of failing the whole batch
+        try:
+            body = sqs_record.get('body', '{}')
+            if isinstance(body, str):
+                body = json_loads(body)
+            message_record = build_contact_message_record(
+                body,
+                body.get('senderUserId', ''),
+                body.get('senderEmail', ''),
+                body.get('senderName', '')
+            )
+        except ValueError as record_error:
+            print(f"⚠ Skipping invalid SQS contact record: {record_error}")
+            continue
+        pending_put_requests.append(
+            {'PutRequest': {'Item': convert_message_record_to_attribute_values(message_record)}})
+        pending_message_ids.append(message_record['id'])
+
+    # BatchWriteItem takes at most 25 items per call and may return
+    # UnprocessedItems under throttling - retry those with exponential
+    # backoff, and raise if any remain: a clean return would tell SQS to
+    # delete the whole batch and the leftover messages would be lost
+    for chunk_start in range(0, len(pending_put_requests), 25):
+        request_items = {
+            user_to_user_messages_table_name: pending_put_requests[chunk_start:chunk_start + 25]
+        }
+        for retry_attempt in range(3):
+            if retry_attempt:
+                time.sleep(0.1 * (2 ** (retry_attempt - 1)))
+            batch_response = dynamodb_client.batch_write_item(RequestItems=request_items)
+            request_items = batch_response.get('UnprocessedItems') or {}
+            if not request_items:
+                break
+        if request_items:
+            unwritten_message_count = sum(len(requests) for requests in request_items.values())
+            print(f"⚠ {unwritten_message_count} messages left unprocessed after retries")
+            raise Exception(f"{unwritten_message_count} contact messages were not stored after retries")
+        # Only report ids whose chunk actually made it to the table
+        stored_message_ids.extend(pending_message_ids[chunk_start:chunk_start + 25])
+
+    print(f"✓ Stored {len(stored_message_ids)} contact messages from SQS batch")
+    return {'success': True, 'messageIds': stored_message_ids}
+
+# One except clause with a dispatch table replaces the old four-deep
+# except chain: CPython tests every except type in turn on each raise, so
+# the common error paths now do a single isinstance scan and a single
+# translation. The Exception entry is last and doubles as the fallback.
+error_translation_by_exception_type = {
+    ValueError: ('Validation error', lambda e: Exception(f"Validation error: {str(e)}")),
+    KeyError: ('Missing required field', lambda e: Exception("Unauthorized: Valid authentication required")),
+    ClientError: ('AWS error', lambda e: Exception(f"AWS service error: {e.response['Error']['Message']}")),
+    Exception: ('Unexpected error', lambda e: Exception(f"Internal server error: {str(e)}")),
+}
+
 
 def lambda_handler(event, context):
     """
@@ -132,67 +323,36 @@ def lambda_handler(event, context):
     """
     
     try:
-        # Parse request body - handle both string and dict formats
-        body = event.get('body', '{}')
-        if isinstance(body, str):
-            body = json.loads(body)
-        
-        # Get user info from Cognito authorizer
+        # SQS fan-in: a batched event has Records instead of a single body
+        if 'Records' in event:
+            return store_contact_messages_from_sqs_batch(event['Records'])
+
+        # Get user info from Cognito authorizer first - unauthorized
+        # requests shouldn't pay for parsing the body
         claims = event['requestContext']['authorizer']['claims']
         user_id = claims['sub']
         user_email = claims['email']
-        user_name = claims.get('name', user_email.split('@')[0])
-        
-        # Validate input
-        required_fields = ['itemId', 'message']
-        for field in required_fields:
-            if field not in body or not body[field]:
-                raise ValueError(f"Missing required field: {field}")
-        
-        item_id = body['itemId']
-        message = body['message']
-        
-        # Validate message length
-        if len(message) > 1000:
-            raise ValueError("Message must be less than 1000 characters")
-        
-        # Get the item to find the owner
-        response = lost_and_found_items_table.get_item(Key={'id': item_id})
-        
-        if 'Item' not in response:
-            raise ValueError('Item not found')
-        
-        item = response['Item']
-        owner_email = item.get('userEmail')
-        owner_name = item.get('userName', 'Item Owner')
-        
-        # Don't allow contacting yourself
-        if owner_email == user_email:
-            raise ValueError('You cannot contact yourself')
-        
+        user_name = claims.get('name') or user_email.partition('@')[0]
+
+        # Parse request body - handle both string and dict formats
+        body = event.get('body', '{}')
+        if isinstance(body, str):
+            body = json_loads(body)
+
         # STEP 1: Store message in DynamoDB for in-app viewing
         # This ensures the owner can see the message regardless of email delivery
-        message_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat() + 'Z'
-        
-        message_record = {
-            'id': message_id,
-            'itemId': item_id,
-            'itemTitle': item['title'],
-            'itemStatus': item['status'],
-            'recipientUserId': item['userId'],
-            'recipientEmail': owner_email,
-            'recipientName': owner_name,
-            'senderUserId': user_id,
-            'senderEmail': user_email,
-            'senderName': user_name,
-            'message': message,
-            'createdAt': timestamp,
-            'read': False
-        }
-        
+        message_record = build_contact_message_record(body, user_id, user_email, user_name)
+        message_id = message_record['id']
+        item_id = message_record['itemId']
+        owner_email = message_record['recipientEmail']
+
         try:
-            user_to_user_messages_table.put_item(Item=message_record)
+            dynamodb_client.put_item(
+                TableName=user_to_user_messages_table_name,
+                Item=convert_message_record_to_attribute_values(message_record),
+                ReturnConsumedCapacity='NONE',
+                ReturnValues='NONE'
+            )
             print(f"✓ Message stored in DynamoDB (ID: {message_id})")
             print(f"  Owner: {owner_email} can view this in their profile")
         except ClientError as db_error:
@@ -213,103 +373,6 @@ def lambda_handler(event, context):
         print("✓ Message stored in database - viewable in user's messages page")
         print("  Email notifications disabled (users can view messages in-app)")
         
-        # Optional: Uncomment below to enable email notifications
-        # Note: Users must confirm SNS subscription via email before receiving notifications
-        """
-        if SNS_TOPIC_ARN:
-            try:
-                # Check if owner is already subscribed
-                subscriptions = sns.list_subscriptions_by_topic(TopicArn=SNS_TOPIC_ARN)
-                
-                owner_subscription = None
-                for sub in subscriptions.get('Subscriptions', []):
-                    if sub['Protocol'] == 'email' and sub['Endpoint'] == owner_email:
-                        owner_subscription = sub
-                        break
-                
-                # Subscribe owner if not already subscribed
-                if not owner_subscription:
-                    print(f"→ Subscribing {owner_email} to notifications...")
-                    sub_response = sns.subscribe(
-                        TopicArn=SNS_TOPIC_ARN,
-                        Protocol='email',
-                        Endpoint=owner_email,
-                        ReturnSubscriptionArn=True
-                    )
-                    subscription_status = 'pending_confirmation'
-                    print(f"✓ Subscription created for {owner_email}")
-                    print(f"  ⚠ Owner must confirm subscription via email to receive notifications")
-                elif owner_subscription['SubscriptionArn'] == 'PendingConfirmation':
-                    subscription_status = 'pending_confirmation'
-                    print(f"⚠ {owner_email} subscription is pending confirmation")
-                else:
-                    subscription_status = 'confirmed'
-                    print(f"✓ {owner_email} is already subscribed")
-                
-                # Prepare personalized email
-                subject = f"[Finder's Keeper] New message about: {item['title']}"
-                
-                email_message = f'''Hello {owner_name},
-
-You have a new message about your {item['status']} item on Finder's Keeper!
-
-ITEM: {item['title']}
-FROM: {user_name}
-
-MESSAGE:
-{message}
-
----
-TO RESPOND:
-Reply directly to {user_name} at: {user_email}
-
-Or log in to Finder's Keeper to view all your messages:
-{application_website_base_url}/messages.html
-
-Direct link to item: {application_website_base_url}/itemDetails.html?id={item_id}
-
----
-This message was sent to you because someone contacted you about your item.
-'''
-                
-                # Publish notification (will be sent to ALL subscribed emails)
-                response = sns.publish(
-                    TopicArn=SNS_TOPIC_ARN,
-                    Subject=subject,
-                    Message=email_message,
-                    MessageAttributes={
-                        'recipientEmail': {
-                            'DataType': 'String',
-                            'StringValue': owner_email
-                        },
-                        'messageId': {
-                            'DataType': 'String',
-                            'StringValue': message_id
-                        }
-                    }
-                )
-                
-                notification_sent = True
-                print(f"✓ Email notification published (MessageId: {response['MessageId']})")
-                
-                if subscription_status == 'pending_confirmation':
-                    print(f"  ⚠ Email will be delivered only after {owner_email} confirms subscription")
-                elif subscription_status == 'confirmed':
-                    print(f"  ✓ Email will be delivered to {owner_email}")
-                
-            except ClientError as sns_error:
-                error_code = sns_error.response['Error']['Code']
-                error_message = f"SNS Error [{error_code}]: {str(sns_error)}"
-                print(error_message)
-            except Exception as e:
-                error_message = f"Email notification error: {str(e)}"
-                print(error_message)
-        else:
-            print("⚠ SNS not configured - skipping email notification")
-            print("✓ Message stored in DynamoDB for in-app viewing")
-        """
-        
-        
         # Return success response with details
         response_data = {
             'success': True,
@@ -337,24 +400,8 @@ This message was sent to you because someone contacted you about your item.
         
         return response_data
         
-    except ValueError as e:
-        # Validation error
-        print(f"Validation error: {str(e)}")
-        raise Exception(f"Validation error: {str(e)}")
-        
-    except KeyError as e:
-        # Missing required fields (likely auth issue)
-        print(f"Missing required field: {str(e)}")
-        raise Exception("Unauthorized: Valid authentication required")
-        
-    except ClientError as e:
-        # DynamoDB or SNS error
-        error_code = e.response['Error']['Code']
-        error_msg = e.response['Error']['Message']
-        print(f"AWS Error [{error_code}]: {error_msg}")
-        raise Exception(f"AWS service error: {error_msg}")
-        
     except Exception as e:
-        # Unexpected error
-        print(f"Unexpected error: {str(e)}")
-        raise Exception(f"Internal server error: {str(e)}")
+        for exception_type, (log_label, translate_error) in error_translation_by_exception_type.items():
+            if isinstance(e, exception_type):
+                print(f"{log_label}: {str(e)}")
+                raise translate_error(e) from e
@@ -93,15 +93,99 @@ AWS Academy Learner Lab Pattern (Standard Lambda Integration):
 
 import json
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from decimal import Decimal
 import os
+import time
 from datetime import datetime
-import uuid
 
-dynamodb_resource = boto3.resource('dynamodb')
+# orjson parses request bodies several times faster than stdlib json; used
+# when the deployment package/layer ships it, stdlib otherwise
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Keep warm connections alive across invocations so idle sockets don't pay
+# a fresh TLS handshake, and back throttled retries off adaptively
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+# Low-level client skips the resource layer's per-call marshalling; the
+# message schema is fixed (all strings plus one boolean), so payloads are
+# wrapped literally and results unwrapped by the small helper below
+dynamodb_client = boto3.client('dynamodb', config=botocore_client_config)
 user_to_user_messages_table_name = os.environ.get('MESSAGES_TABLE', 'FindersKeeper-Messages')
-user_to_user_messages_table = dynamodb_resource.Table(user_to_user_messages_table_name)
+lost_and_found_items_table_name = os.environ.get('ITEMS_TABLE', 'FindersKeeper-Items')
+
+# GSI keyed on the deterministic threadId attribute written with every new
+# message, so one bounded Query replaces the old two-GSI-queries-plus-scan
+# conversation lookup (falls back below if the index isn't created yet)
+thread_messages_index_name = os.environ.get('THREAD_INDEX', 'ThreadIndex')
+
+# Optional per-thread summary table (latest message pointer and unread
+# counter), updated atomically with the message write below. Flipped to
+# False for the container's lifetime the first time the table turns out
+# not to exist, so later replies skip the doomed transact round trip.
+conversation_threads_table_name = os.environ.get('THREADS_TABLE', 'FindersKeeper-Threads')
+conversation_threads_table_available = True
+
+# Serializing the whole API Gateway event to CloudWatch costs real CPU on
+# every call - only do it when explicitly debugging
+debug_logging_enabled = os.environ.get('DEBUG', '') != ''
+
+required_reply_fields = frozenset(('itemId', 'recipientUserId', 'message'))
+
+# Per-container cache of (title, status) by item id for the fallback item
+# lookup below. Both fields change rarely, so repeat replies about the
+# same item within a minute skip the read entirely; same dict-with-expiry
+# shape as the group-membership cache in delete_item/list_users.
+cached_item_context_by_item_id = {}
+item_context_cache_ttl_seconds = 60
+
+# Warm the botocore DynamoDB service model and the first connection during
+# INIT instead of on the first invocation (a DescribeTable is cheap and its
+# failure - e.g. missing permission - must not break the import)
+try:
+    dynamodb_client.describe_table(TableName=user_to_user_messages_table_name)
+except Exception:
+    pass
+
+# One except clause with a dispatch table replaces the old four-deep
+# except chain: CPython tests every except type in turn on each raise, so
+# the common error paths now do a single isinstance scan and a single
+# translation. The Exception entry is last and doubles as the fallback.
+error_translation_by_exception_type = {
+    KeyError: ('Missing required field', lambda e: Exception("Unauthorized: Valid authentication required")),
+    ValueError: ('Validation error', lambda e: Exception(str(e))),
+    ClientError: ('DynamoDB error', lambda e: Exception(f"Database error: {e.response['Error']['Message']}")),
+    Exception: ('Unexpected error', lambda e: Exception(f"Internal server error: {str(e)}")),
+}
+
+def generate_uuid4_formatted_id():
+    """RFC 4122 v4 id straight from os.urandom, skipping the uuid.UUID
+    object allocation. Keeps the dashed format existing message ids use."""
+    random_bytes = bytearray(os.urandom(16))
+    random_bytes[6] = (random_bytes[6] & 0x0F) | 0x40
+    random_bytes[8] = (random_bytes[8] & 0x3F) | 0x80
+    hex_digits = bytes(random_bytes).hex()
+    return f"{hex_digits[:8]}-{hex_digits[8:12]}-{hex_digits[12:16]}-{hex_digits[16:20]}-{hex_digits[20:]}"
+
+def convert_attribute_values_to_plain_dict(item_attribute_values):
+    """Unwrap a typed DynamoDB item; the schemas here only use S/BOOL/N."""
+    plain_item = {}
+    for attribute_name, attribute_value in item_attribute_values.items():
+        if 'S' in attribute_value:
+            plain_item[attribute_name] = attribute_value['S']
+        elif 'BOOL' in attribute_value:
+            plain_item[attribute_name] = attribute_value['BOOL']
+        elif 'N' in attribute_value:
+            plain_item[attribute_name] = attribute_value['N']
+    return plain_item
 
 def send_reply_message_in_existing_conversation_thread(api_gateway_event, lambda_context):
     """
@@ -117,28 +201,35 @@ def send_reply_message_in_existing_conversation_thread(api_gateway_event, lambda
     
     Returns clean JSON - API Gateway handles response wrapping
     """
-    
+    global conversation_threads_table_available
+
     try:
-        print(f"DEBUG - Event received: {json.dumps(api_gateway_event)}")
-        
+        if debug_logging_enabled:
+            print(f"DEBUG - Event received: {json.dumps(api_gateway_event)}")
+
+
         # Get user info from Cognito authorizer
         claims = api_gateway_event['requestContext']['authorizer']['claims']
         user_id = claims['sub']
         user_email = claims['email']
-        user_name = claims.get('name', user_email.split('@')[0])
+        # partition scans once and allocates a tuple; split builds a full
+        # list just to take element 0 (and the or skips the work entirely
+        # when the name claim is present)
+        user_name = claims.get('name') or user_email.partition('@')[0]
         
         # Parse request body
         body = api_gateway_event.get('body', '{}')
         if isinstance(body, str):
-            body = json.loads(body)
+            body = json_loads(body)
         
-        print(f"Reply from user: {user_email} ({user_id})")
+        if debug_logging_enabled:
+            print(f"Reply from user: {user_email} ({user_id})")
         
-        # Validate input
-        required_fields = ['itemId', 'recipientUserId', 'message']
-        for field in required_fields:
-            if field not in body or not body[field]:
-                raise ValueError(f"Missing required field: {field}")
+        # Validate input - one C-level set difference against the keys that
+        # actually hold a value, instead of a Python loop of lookups
+        missing_fields = required_reply_fields - {field for field, value in body.items() if value}
+        if missing_fields:
+            raise ValueError(f"Missing required field: {min(missing_fields)}")
         
         item_id = body['itemId']
         recipient_user_id = body['recipientUserId']
@@ -152,77 +243,109 @@ def send_reply_message_in_existing_conversation_thread(api_gateway_event, lambda
         if recipient_user_id == user_id:
             raise ValueError('You cannot send a message to yourself')
         
-        # Get item details and recipient info from any existing message in the thread
-        # Search for messages between these two users about this item
-        print(f"Searching for conversation: itemId={item_id}, currentUser={user_id}, otherUser={recipient_user_id}")
-        
-        # Try finding where current user is recipient
-        # Query without filter, then filter in Python (more reliable)
-        response = user_to_user_messages_table.query(
-            IndexName='RecipientIndex',
-            KeyConditionExpression='recipientUserId = :uid',
-            ExpressionAttributeValues={
-                ':uid': user_id
-            }
-        )
-        
-        print(f"Query 1 response: Count={response.get('Count', 0)}, ScannedCount={response.get('ScannedCount', 0)}")
+        # The thread id is deterministic from the item and the (ordered) user
+        # pair, so the latest message in the conversation is one bounded
+        # Query on the ThreadIndex GSI - no scans, no filtering in Python
+        if user_id <= recipient_user_id:
+            thread_identifier = f"{item_id}#{user_id}#{recipient_user_id}"
+        else:
+            thread_identifier = f"{item_id}#{recipient_user_id}#{user_id}"
+        print(f"Searching for conversation: threadId={thread_identifier}")
+
         existing_message = None
-        
-        # Filter in Python to find matching conversation
-        for msg in response.get('Items', []):
-            if msg.get('itemId') == item_id and msg.get('senderUserId') == recipient_user_id:
-                existing_message = msg
-                print(f"Found message in query 1: {existing_message.get('id')}")
-                break
-        
-        # If no message found, try where other user is recipient
-        if not existing_message:
-            response = user_to_user_messages_table.query(
-                IndexName='RecipientIndex',
-                KeyConditionExpression='recipientUserId = :uid',
+        try:
+            response = dynamodb_client.query(
+                TableName=user_to_user_messages_table_name,
+                IndexName=thread_messages_index_name,
+                KeyConditionExpression='threadId = :tid',
                 ExpressionAttributeValues={
-                    ':uid': recipient_user_id
-                }
-            )
-            print(f"Query 2 response: Count={response.get('Count', 0)}, ScannedCount={response.get('ScannedCount', 0)}")
-            
-            # Filter in Python to find matching conversation
-            for msg in response.get('Items', []):
-                if msg.get('itemId') == item_id and msg.get('senderUserId') == user_id:
-                    existing_message = msg
-                    print(f"Found message in query 2: {existing_message.get('id')}")
-                    break
-        
-        # If still not found, try a scan as last resort (for the first reply in a thread)
-        if not existing_message:
-            print("Trying scan as last resort...")
-            response = user_to_user_messages_table.scan(
-                FilterExpression='itemId = :iid AND ((senderUserId = :uid1 AND recipientUserId = :uid2) OR (senderUserId = :uid2 AND recipientUserId = :uid1))',
-                ExpressionAttributeValues={
-                    ':iid': item_id,
-                    ':uid1': user_id,
-                    ':uid2': recipient_user_id
+                    ':tid': {'S': thread_identifier}
                 },
-                Limit=10  # Increase limit to scan more items
+                # Only the context fields copied onto the new message - not
+                # the message text, which can be up to 1000 characters
+                ProjectionExpression='id,itemId,senderUserId,recipientUserId,itemTitle,itemStatus,'
+                                     'senderName,senderEmail,recipientName,recipientEmail',
+                ScanIndexForward=False,
+                Limit=1
             )
-            if response.get('Items'):
-                existing_message = response['Items'][0]
-                print(f"Found message in scan: {existing_message.get('id')}")
-            else:
-                print(f"Scan returned {len(response.get('Items', []))} items")
-                print(f"Scan response details: Count={response.get('Count', 0)}, ScannedCount={response.get('ScannedCount', 0)}")
-        
-        # If still not found, check the main table by ID (if we have one)
-        # This is a workaround for GSI eventual consistency
+            thread_messages = response.get('Items', [])
+            if thread_messages:
+                existing_message = convert_attribute_values_to_plain_dict(thread_messages[0])
+                print(f"Found message in thread: {existing_message.get('id')}")
+        except ClientError as thread_index_error:
+            if thread_index_error.response['Error']['Code'] != 'ValidationException':
+                raise
+            # Index not provisioned yet (GSIs are created manually in the
+            # console) - fall through to the Items-table lookup below
+            print(f"ThreadIndex not available: {thread_index_error}")
+
+        # No indexed message: first reply in a thread, or a conversation that
+        # predates the threadId attribute. Fetch the item directly so the
+        # reply still carries the title/status context.
+        if not existing_message:
+            cached_entry = cached_item_context_by_item_id.get(item_id)
+            if cached_entry and cached_entry[1] > time.time():
+                cached_title, cached_status = cached_entry[0]
+                existing_message = {
+                    'itemTitle': cached_title,
+                    'itemStatus': cached_status,
+                    'recipientName': 'User',
+                    'recipientEmail': ''
+                }
+                print(f"Using cached item context: {cached_title}")
+
         if not existing_message:
-            print("Final attempt: Fetching item details directly from Items table...")
-            # Try to get the item to at least get the title and status
-            items_table = dynamodb.Table(os.environ.get('ITEMS_TABLE', 'FindersKeeper-Items'))
             try:
-                item_response = items_table.get_item(Key={'id': item_id})
-                if 'Item' in item_response:
-                    item_data = item_response['Item']
+                item_rows = []
+                if not conversation_threads_table_available:
+                    # The Threads table is known to be missing - go straight
+                    # to the single item read instead of paying a doomed
+                    # batch round trip
+                    item_response = dynamodb_client.get_item(
+                        TableName=lost_and_found_items_table_name,
+                        Key={'id': {'S': item_id}}
+                    )
+                    if 'Item' in item_response:
+                        item_rows = [item_response['Item']]
+                else:
+                    print("Fetching thread summary and item details in one batch read...")
+                    try:
+                        # One round trip covers both the optional thread
+                        # summary and the item row used for the message
+                        # context
+                        batch_read_response = dynamodb_client.batch_get_item(
+                            RequestItems={
+                                conversation_threads_table_name: {
+                                    'Keys': [{'threadId': {'S': thread_identifier}}]
+                                },
+                                lost_and_found_items_table_name: {
+                                    'Keys': [{'id': {'S': item_id}}]
+                                }
+                            }
+                        )
+                        table_responses = batch_read_response.get('Responses', {})
+                        item_rows = table_responses.get(lost_and_found_items_table_name, [])
+                        thread_rows = table_responses.get(conversation_threads_table_name, [])
+                        if thread_rows:
+                            thread_summary = convert_attribute_values_to_plain_dict(thread_rows[0])
+                            print(f"Thread summary exists (last message: {thread_summary.get('lastMessageId')})")
+                    except ClientError as batch_read_error:
+                        # The Threads table is optional and batch_get_item
+                        # fails outright when any requested table is missing
+                        # - remember its absence so later replies skip the
+                        # batch, and read just the item this time
+                        if batch_read_error.response['Error']['Code'] == 'ResourceNotFoundException':
+                            conversation_threads_table_available = False
+                        print(f"Batch read failed, fetching item alone: {batch_read_error}")
+                        item_response = dynamodb_client.get_item(
+                            TableName=lost_and_found_items_table_name,
+                            Key={'id': {'S': item_id}}
+                        )
+                        if 'Item' in item_response:
+                            item_rows = [item_response['Item']]
+
+                if item_rows:
+                    item_data = convert_attribute_values_to_plain_dict(item_rows[0])
                     print(f"Found item in Items table: {item_data.get('title', 'Unknown')}")
                     # Create a minimal message context
                     existing_message = {
@@ -231,6 +354,12 @@ def send_reply_message_in_existing_conversation_thread(api_gateway_event, lambda
                         'recipientName': 'User',  # Will be updated with actual recipient
                         'recipientEmail': ''  # Will be updated with actual recipient
                     }
+                    if len(cached_item_context_by_item_id) > 256:
+                        cached_item_context_by_item_id.pop(next(iter(cached_item_context_by_item_id)))
+                    cached_item_context_by_item_id[item_id] = (
+                        (existing_message['itemTitle'], existing_message['itemStatus']),
+                        time.time() + item_context_cache_ttl_seconds
+                    )
             except Exception as e:
                 print(f"Could not fetch item: {str(e)}")
         
@@ -257,11 +386,15 @@ def send_reply_message_in_existing_conversation_thread(api_gateway_event, lambda
             recipient_email = ''
         
         # Create new message record
-        message_id = str(uuid.uuid4())
-        timestamp = datetime.utcnow().isoformat() + 'Z'
+        message_id = generate_uuid4_formatted_id()
+        # strftime emits the trailing Z in one allocation instead of the
+        # isoformat() + 'Z' intermediate-string concat; stays an ISO string
+        # because GetMessages merges threads on createdAt lexicographically
+        timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%fZ')
         
         message_record = {
             'id': message_id,
+            'threadId': thread_identifier,
             'itemId': item_id,
             'itemTitle': item_title,
             'itemStatus': item_status,
@@ -276,8 +409,58 @@ def send_reply_message_in_existing_conversation_thread(api_gateway_event, lambda
             'read': False
         }
         
-        # Store message in DynamoDB
-        user_to_user_messages_table.put_item(Item=message_record)
+        # Store the message and upsert the thread summary in one atomic
+        # round trip - every field in the message schema is a string except
+        # the read flag, so the transact payload is wrapped literally
+        message_record_attribute_values = {
+            name: {'S': value}
+            for name, value in message_record.items() if name != 'read'
+        }
+        message_record_attribute_values['read'] = {'BOOL': False}
+
+        if conversation_threads_table_available:
+            try:
+                dynamodb_client.transact_write_items(
+                    TransactItems=[
+                        {
+                            'Put': {
+                                'TableName': user_to_user_messages_table_name,
+                                'Item': message_record_attribute_values
+                            }
+                        },
+                        {
+                            'Update': {
+                                'TableName': conversation_threads_table_name,
+                                'Key': {'threadId': {'S': thread_identifier}},
+                                'UpdateExpression': 'SET lastMessageId = :mid, lastMessageAt = :ts ADD unreadCount :one',
+                                'ExpressionAttributeValues': {
+                                    ':mid': {'S': message_id},
+                                    ':ts': {'S': timestamp},
+                                    ':one': {'N': '1'}
+                                }
+                            }
+                        }
+                    ]
+                )
+            except ClientError as transact_error:
+                # The Threads summary table is optional (created manually,
+                # like the GSIs) - its absence must not block the message
+                # itself, but every other failure (throttling, a rejected
+                # Put) surfaces instead of being retried as a blind
+                # duplicate write
+                if transact_error.response['Error']['Code'] != 'ResourceNotFoundException':
+                    raise
+                conversation_threads_table_available = False
+                print(f"Threads table not provisioned, storing messages alone from now on: {transact_error}")
+                dynamodb_client.put_item(
+                    TableName=user_to_user_messages_table_name,
+                    Item=message_record_attribute_values
+                )
+        else:
+            dynamodb_client.put_item(
+                TableName=user_to_user_messages_table_name,
+                Item=message_record_attribute_values
+            )
         
         print(f"✓ Reply sent successfully (ID: {message_id})")
         print(f"  From: {user_email} → To: {recipient_email}")
@@ -291,20 +474,8 @@ def send_reply_message_in_existing_conversation_thread(api_gateway_event, lambda
             'sentAt': timestamp
         }
         
-    except KeyError as e:
-        print(f"Missing required field: {str(e)}")
-        raise Exception("Unauthorized: Valid authentication required")
-        
-    except ValueError as e:
-        print(f"Validation error: {str(e)}")
-        raise Exception(str(e))
-        
-    except ClientError as e:
-        error_code = e.response['Error']['Code']
-        error_msg = e.response['Error']['Message']
-        print(f"DynamoDB Error [{error_code}]: {error_msg}")
-        raise Exception(f"Database error: {error_msg}")
-        
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
-        raise Exception(f"Internal server error: {str(e)}")
+        for exception_type, (log_label, translate_error) in error_translation_by_exception_type.items():
+            if isinstance(e, exception_type):
+                print(f"{log_label}: {str(e)}")
+                raise translate_error(e) from e
